@@ -6,215 +6,265 @@ d = { 'settings': { 'branch': 'main',
                 'git_url': 'https://github.com/srippa/mvgutils/',
                 'lib_path': 'mvgutils'},
   'syms': { 'mvgutils.camera': { 'mvgutils.camera.Intrinsicts': ('camera.html#intrinsicts', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.K': ('camera.html#k', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.K_3': ('camera.html#k_3', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.K_3_inv': ('camera.html#k_3_inv', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.K_inv': ('camera.html#k_inv', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.__init__': ('camera.html#__init__', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.__str__': ('camera.html#__str__', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts._get_params_to_new_cx_cy_fx_fy': ( 'camera.html#_get_params_to_new_cx_cy_fx_fy',
+                                 'mvgutils.camera.Intrinsicts.K': ('camera.html#intrinsicts.k', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.K_3': ('camera.html#intrinsicts.k_3', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.K_3_inv': ('camera.html#intrinsicts.k_3_inv', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.K_inv': ('camera.html#intrinsicts.k_inv', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.__init__': ('camera.html#intrinsicts.__init__', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.__str__': ('camera.html#intrinsicts.__str__', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts._get_params_to_new_cx_cy_fx_fy': ( 'camera.html#intrinsicts._get_params_to_new_cx_cy_fx_fy',
                                                                                                  'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts._set_params': ('camera.html#_set_params', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.as_dict': ('camera.html#as_dict', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.camera2image_points': ( 'camera.html#camera2image_points',
+                                 'mvgutils.camera.Intrinsicts._set_params': ('camera.html#intrinsicts._set_params', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.as_dict': ('camera.html#intrinsicts.as_dict', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.camera2image_points': ( 'camera.html#intrinsicts.camera2image_points',
                                                                                       'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.camera_model_name': ('camera.html#camera_model_name', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.crop': ('camera.html#crop', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.crop_bbox': ('camera.html#crop_bbox', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.cx': ('camera.html#cx', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.cy': ('camera.html#cy', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.distort_points': ('camera.html#distort_points', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.distortions': ('camera.html#distortions', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.from_opencv_fisheye_model': ( 'camera.html#from_opencv_fisheye_model',
+                                 'mvgutils.camera.Intrinsicts.camera_model_name': ( 'camera.html#intrinsicts.camera_model_name',
+                                                                                    'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.crop': ('camera.html#intrinsicts.crop', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.crop_bbox': ('camera.html#intrinsicts.crop_bbox', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.cx': ('camera.html#intrinsicts.cx', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.cy': ('camera.html#intrinsicts.cy', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.distort_points': ( 'camera.html#intrinsicts.distort_points',
+                                                                                 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.distortions': ('camera.html#intrinsicts.distortions', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.from_opencv_fisheye_model': ( 'camera.html#intrinsicts.from_opencv_fisheye_model',
                                                                                             'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.from_opencv_model': ('camera.html#from_opencv_model', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.from_pinhole_model': ('camera.html#from_pinhole_model', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.from_test_model': ('camera.html#from_test_model', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.fx': ('camera.html#fx', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.fy': ('camera.html#fy', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.get_fov': ('camera.html#get_fov', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.get_optimal_new_camera_matrix': ( 'camera.html#get_optimal_new_camera_matrix',
+                                 'mvgutils.camera.Intrinsicts.from_opencv_model': ( 'camera.html#intrinsicts.from_opencv_model',
+                                                                                    'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.from_pinhole_model': ( 'camera.html#intrinsicts.from_pinhole_model',
+                                                                                     'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.from_test_model': ( 'camera.html#intrinsicts.from_test_model',
+                                                                                  'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.fx': ('camera.html#intrinsicts.fx', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.fy': ('camera.html#intrinsicts.fy', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.get_fov': ('camera.html#intrinsicts.get_fov', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.get_optimal_new_camera_matrix': ( 'camera.html#intrinsicts.get_optimal_new_camera_matrix',
                                                                                                 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.get_params': ('camera.html#get_params', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.get_undistort_matrix': ( 'camera.html#get_undistort_matrix',
+                                 'mvgutils.camera.Intrinsicts.get_params': ('camera.html#intrinsicts.get_params', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.get_undistort_matrix': ( 'camera.html#intrinsicts.get_undistort_matrix',
                                                                                        'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.h': ('camera.html#h', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.height': ('camera.html#height', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.icv_get_rectangles': ('camera.html#icv_get_rectangles', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.is_single_focal_lenght': ( 'camera.html#is_single_focal_lenght',
+                                 'mvgutils.camera.Intrinsicts.h': ('camera.html#intrinsicts.h', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.height': ('camera.html#intrinsicts.height', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.icv_get_rectangles': ( 'camera.html#intrinsicts.icv_get_rectangles',
+                                                                                     'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.is_single_focal_lenght': ( 'camera.html#intrinsicts.is_single_focal_lenght',
                                                                                          'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.project_and_distort_points': ( 'camera.html#project_and_distort_points',
+                                 'mvgutils.camera.Intrinsicts.project_and_distort_points': ( 'camera.html#intrinsicts.project_and_distort_points',
                                                                                              'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.project_camera_plane_to_3d': ( 'camera.html#project_camera_plane_to_3d',
+                                 'mvgutils.camera.Intrinsicts.project_camera_plane_to_3d': ( 'camera.html#intrinsicts.project_camera_plane_to_3d',
                                                                                              'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.project_image_plane_to_camera_plane': ( 'camera.html#project_image_plane_to_camera_plane',
+                                 'mvgutils.camera.Intrinsicts.project_image_plane_to_camera_plane': ( 'camera.html#intrinsicts.project_image_plane_to_camera_plane',
                                                                                                       'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.project_points': ('camera.html#project_points', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.resize': ('camera.html#resize', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.supported_camera_models': ( 'camera.html#supported_camera_models',
+                                 'mvgutils.camera.Intrinsicts.project_points': ( 'camera.html#intrinsicts.project_points',
+                                                                                 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.resize': ('camera.html#intrinsicts.resize', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.supported_camera_models': ( 'camera.html#intrinsicts.supported_camera_models',
                                                                                           'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.to_dict': ('camera.html#to_dict', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.to_image_points': ('camera.html#to_image_points', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.undistort': ('camera.html#undistort', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.w': ('camera.html#w', 'mvgutils/camera.py'),
-                                 'mvgutils.camera.Intrinsicts.width': ('camera.html#width', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.to_dict': ('camera.html#intrinsicts.to_dict', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.to_image_points': ( 'camera.html#intrinsicts.to_image_points',
+                                                                                  'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.undistort': ('camera.html#intrinsicts.undistort', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.w': ('camera.html#intrinsicts.w', 'mvgutils/camera.py'),
+                                 'mvgutils.camera.Intrinsicts.width': ('camera.html#intrinsicts.width', 'mvgutils/camera.py'),
                                  'mvgutils.camera.from_homogeneous': ('camera.html#from_homogeneous', 'mvgutils/camera.py'),
                                  'mvgutils.camera.to_homogeneous': ('camera.html#to_homogeneous', 'mvgutils/camera.py')},
-            'mvgutils.intrinsics': { 'mvgutils.intrinsics.Intrinsics': ('intrinsics.html#intrinsics', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.K': ('intrinsics.html#k', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.K_3': ('intrinsics.html#k_3', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.K_3_inv': ('intrinsics.html#k_3_inv', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.K_inv': ('intrinsics.html#k_inv', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.__init__': ('intrinsics.html#__init__', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.__str__': ('intrinsics.html#__str__', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics._get_params_to_new_cx_cy_fx_fy': ( 'intrinsics.html#_get_params_to_new_cx_cy_fx_fy',
-                                                                                                        'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics._icv_get_rectangles': ( 'intrinsics.html#_icv_get_rectangles',
+            'mvgutils.intrinsics': { 'mvgutils.intrinsics.FoV': ('intrinsics.html#fov', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics': ('intrinsics.html#intrinsics', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.K': ('intrinsics.html#intrinsics.k', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.K_3': ('intrinsics.html#intrinsics.k_3', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.K_3_inv': ( 'intrinsics.html#intrinsics.k_3_inv',
+                                                                                 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.K_inv': ('intrinsics.html#intrinsics.k_inv', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.__init__': ( 'intrinsics.html#intrinsics.__init__',
+                                                                                  'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.__str__': ( 'intrinsics.html#intrinsics.__str__',
+                                                                                 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics._distort_jac_torch': ( 'intrinsics.html#intrinsics._distort_jac_torch',
+                                                                                            'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics._distort_points_torch': ( 'intrinsics.html#intrinsics._distort_points_torch',
+                                                                                               'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics._icv_get_rectangles': ( 'intrinsics.html#intrinsics._icv_get_rectangles',
                                                                                              'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics._set_params': ( 'intrinsics.html#_set_params',
+                                     'mvgutils.intrinsics.Intrinsics._pack_params': ( 'intrinsics.html#intrinsics._pack_params',
+                                                                                      'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics._set_params': ( 'intrinsics.html#intrinsics._set_params',
                                                                                      'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.as_dict': ('intrinsics.html#as_dict', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.camera2image_points': ( 'intrinsics.html#camera2image_points',
+                                     'mvgutils.intrinsics.Intrinsics._torch_affine': ( 'intrinsics.html#intrinsics._torch_affine',
+                                                                                       'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.as_dict': ( 'intrinsics.html#intrinsics.as_dict',
+                                                                                 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.camera2image_points': ( 'intrinsics.html#intrinsics.camera2image_points',
                                                                                              'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.camera_model_name': ( 'intrinsics.html#camera_model_name',
+                                     'mvgutils.intrinsics.Intrinsics.camera_model_name': ( 'intrinsics.html#intrinsics.camera_model_name',
                                                                                            'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.crop': ('intrinsics.html#crop', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.cx': ('intrinsics.html#cx', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.cy': ('intrinsics.html#cy', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.distort_points': ( 'intrinsics.html#distort_points',
+                                     'mvgutils.intrinsics.Intrinsics.crop': ('intrinsics.html#intrinsics.crop', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.cx': ('intrinsics.html#intrinsics.cx', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.cy': ('intrinsics.html#intrinsics.cy', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.distort_points': ( 'intrinsics.html#intrinsics.distort_points',
                                                                                         'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.distortions': ( 'intrinsics.html#distortions',
+                                     'mvgutils.intrinsics.Intrinsics.distortions': ( 'intrinsics.html#intrinsics.distortions',
                                                                                      'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.from_opencv_fisheye_model': ( 'intrinsics.html#from_opencv_fisheye_model',
+                                     'mvgutils.intrinsics.Intrinsics.from_opencv_fisheye_model': ( 'intrinsics.html#intrinsics.from_opencv_fisheye_model',
                                                                                                    'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.from_opencv_model': ( 'intrinsics.html#from_opencv_model',
+                                     'mvgutils.intrinsics.Intrinsics.from_opencv_model': ( 'intrinsics.html#intrinsics.from_opencv_model',
                                                                                            'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.from_pinhole_model': ( 'intrinsics.html#from_pinhole_model',
+                                     'mvgutils.intrinsics.Intrinsics.from_pinhole_model': ( 'intrinsics.html#intrinsics.from_pinhole_model',
                                                                                             'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.from_test_model': ( 'intrinsics.html#from_test_model',
+                                     'mvgutils.intrinsics.Intrinsics.from_test_model': ( 'intrinsics.html#intrinsics.from_test_model',
                                                                                          'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.fx': ('intrinsics.html#fx', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.fy': ('intrinsics.html#fy', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.get_fov': ('intrinsics.html#get_fov', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.get_undistort_camera': ( 'intrinsics.html#get_undistort_camera',
+                                     'mvgutils.intrinsics.Intrinsics.fx': ('intrinsics.html#intrinsics.fx', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.fy': ('intrinsics.html#intrinsics.fy', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.get_fov': ( 'intrinsics.html#intrinsics.get_fov',
+                                                                                 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.get_undistort_camera': ( 'intrinsics.html#intrinsics.get_undistort_camera',
                                                                                               'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.h': ('intrinsics.html#h', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.height': ('intrinsics.html#height', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.init_undistort_rectify_map': ( 'intrinsics.html#init_undistort_rectify_map',
+                                     'mvgutils.intrinsics.Intrinsics.h': ('intrinsics.html#intrinsics.h', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.height': ( 'intrinsics.html#intrinsics.height',
+                                                                                'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.init_undistort_rectify_map': ( 'intrinsics.html#intrinsics.init_undistort_rectify_map',
                                                                                                     'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.is_single_focal_lenght': ( 'intrinsics.html#is_single_focal_lenght',
+                                     'mvgutils.intrinsics.Intrinsics.is_single_focal_lenght': ( 'intrinsics.html#intrinsics.is_single_focal_lenght',
                                                                                                 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.params': ('intrinsics.html#params', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.project_and_distort_points': ( 'intrinsics.html#project_and_distort_points',
+                                     'mvgutils.intrinsics.Intrinsics.params': ( 'intrinsics.html#intrinsics.params',
+                                                                                'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.project_and_distort_points': ( 'intrinsics.html#intrinsics.project_and_distort_points',
                                                                                                     'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.project_points': ( 'intrinsics.html#project_points',
+                                     'mvgutils.intrinsics.Intrinsics.project_points': ( 'intrinsics.html#intrinsics.project_points',
                                                                                         'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.resize': ('intrinsics.html#resize', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.scale': ('intrinsics.html#scale', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.supported_camera_models': ( 'intrinsics.html#supported_camera_models',
+                                     'mvgutils.intrinsics.Intrinsics.resize': ( 'intrinsics.html#intrinsics.resize',
+                                                                                'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.scale': ('intrinsics.html#intrinsics.scale', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.supported_camera_models': ( 'intrinsics.html#intrinsics.supported_camera_models',
                                                                                                  'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.to_camera_points': ( 'intrinsics.html#to_camera_points',
+                                     'mvgutils.intrinsics.Intrinsics.to_camera_points': ( 'intrinsics.html#intrinsics.to_camera_points',
                                                                                           'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.to_dict': ('intrinsics.html#to_dict', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.to_image_points': ( 'intrinsics.html#to_image_points',
+                                     'mvgutils.intrinsics.Intrinsics.to_dict': ( 'intrinsics.html#intrinsics.to_dict',
+                                                                                 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.to_image_points': ( 'intrinsics.html#intrinsics.to_image_points',
                                                                                          'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.undistort_image': ( 'intrinsics.html#undistort_image',
+                                     'mvgutils.intrinsics.Intrinsics.undistort_image': ( 'intrinsics.html#intrinsics.undistort_image',
                                                                                          'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.undistort_points': ( 'intrinsics.html#undistort_points',
+                                     'mvgutils.intrinsics.Intrinsics.undistort_points': ( 'intrinsics.html#intrinsics.undistort_points',
                                                                                           'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.w': ('intrinsics.html#w', 'mvgutils/intrinsics.py'),
-                                     'mvgutils.intrinsics.Intrinsics.width': ('intrinsics.html#width', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.w': ('intrinsics.html#intrinsics.w', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Intrinsics.width': ('intrinsics.html#intrinsics.width', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.Rect': ('intrinsics.html#rect', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics.UndistortMap': ('intrinsics.html#undistortmap', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics._build_param_layout': ( 'intrinsics.html#_build_param_layout',
+                                                                                  'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics._mk_opencv5': ('intrinsics.html#_mk_opencv5', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics._mk_opencv5_jac': ('intrinsics.html#_mk_opencv5_jac', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics._mk_radial': ('intrinsics.html#_mk_radial', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics._mk_radial_jac': ('intrinsics.html#_mk_radial_jac', 'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics._mk_simple_radial': ( 'intrinsics.html#_mk_simple_radial',
+                                                                                'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics._mk_simple_radial_jac': ( 'intrinsics.html#_mk_simple_radial_jac',
+                                                                                    'mvgutils/intrinsics.py'),
+                                     'mvgutils.intrinsics._solve_2x2': ('intrinsics.html#_solve_2x2', 'mvgutils/intrinsics.py'),
                                      'mvgutils.intrinsics.from_homogeneous': ('intrinsics.html#from_homogeneous', 'mvgutils/intrinsics.py'),
                                      'mvgutils.intrinsics.to_homogeneous': ('intrinsics.html#to_homogeneous', 'mvgutils/intrinsics.py')},
             'mvgutils.intrinsicts': { 'mvgutils.intrinsicts.Intrinsicts': ('intrinsicts.html#intrinsicts', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.K': ('intrinsicts.html#k', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.K_3': ('intrinsicts.html#k_3', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.K_3_inv': ('intrinsicts.html#k_3_inv', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.K_inv': ('intrinsicts.html#k_inv', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.__init__': ('intrinsicts.html#__init__', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.__str__': ('intrinsicts.html#__str__', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts._get_params_to_new_cx_cy_fx_fy': ( 'intrinsicts.html#_get_params_to_new_cx_cy_fx_fy',
+                                      'mvgutils.intrinsicts.Intrinsicts.K': ('intrinsicts.html#intrinsicts.k', 'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.K_3': ( 'intrinsicts.html#intrinsicts.k_3',
+                                                                                'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.K_3_inv': ( 'intrinsicts.html#intrinsicts.k_3_inv',
+                                                                                    'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.K_inv': ( 'intrinsicts.html#intrinsicts.k_inv',
+                                                                                  'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.__init__': ( 'intrinsicts.html#intrinsicts.__init__',
+                                                                                     'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.__str__': ( 'intrinsicts.html#intrinsicts.__str__',
+                                                                                    'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts._get_params_to_new_cx_cy_fx_fy': ( 'intrinsicts.html#intrinsicts._get_params_to_new_cx_cy_fx_fy',
                                                                                                            'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts._set_params': ( 'intrinsicts.html#_set_params',
+                                      'mvgutils.intrinsicts.Intrinsicts._set_params': ( 'intrinsicts.html#intrinsicts._set_params',
                                                                                         'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.as_dict': ('intrinsicts.html#as_dict', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.camera2image_points': ( 'intrinsicts.html#camera2image_points',
+                                      'mvgutils.intrinsicts.Intrinsicts.as_dict': ( 'intrinsicts.html#intrinsicts.as_dict',
+                                                                                    'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.camera2image_points': ( 'intrinsicts.html#intrinsicts.camera2image_points',
                                                                                                 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.camera_model_name': ( 'intrinsicts.html#camera_model_name',
+                                      'mvgutils.intrinsicts.Intrinsicts.camera_model_name': ( 'intrinsicts.html#intrinsicts.camera_model_name',
                                                                                               'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.crop': ('intrinsicts.html#crop', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.crop_bbox': ( 'intrinsicts.html#crop_bbox',
+                                      'mvgutils.intrinsicts.Intrinsicts.crop': ( 'intrinsicts.html#intrinsicts.crop',
+                                                                                 'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.crop_bbox': ( 'intrinsicts.html#intrinsicts.crop_bbox',
                                                                                       'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.cx': ('intrinsicts.html#cx', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.cy': ('intrinsicts.html#cy', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.distort_points': ( 'intrinsicts.html#distort_points',
+                                      'mvgutils.intrinsicts.Intrinsicts.cx': ('intrinsicts.html#intrinsicts.cx', 'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.cy': ('intrinsicts.html#intrinsicts.cy', 'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.distort_points': ( 'intrinsicts.html#intrinsicts.distort_points',
                                                                                            'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.distortions': ( 'intrinsicts.html#distortions',
+                                      'mvgutils.intrinsicts.Intrinsicts.distortions': ( 'intrinsicts.html#intrinsicts.distortions',
                                                                                         'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.from_opencv_fisheye_model': ( 'intrinsicts.html#from_opencv_fisheye_model',
+                                      'mvgutils.intrinsicts.Intrinsicts.from_opencv_fisheye_model': ( 'intrinsicts.html#intrinsicts.from_opencv_fisheye_model',
                                                                                                       'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.from_opencv_model': ( 'intrinsicts.html#from_opencv_model',
+                                      'mvgutils.intrinsicts.Intrinsicts.from_opencv_model': ( 'intrinsicts.html#intrinsicts.from_opencv_model',
                                                                                               'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.from_pinhole_model': ( 'intrinsicts.html#from_pinhole_model',
+                                      'mvgutils.intrinsicts.Intrinsicts.from_pinhole_model': ( 'intrinsicts.html#intrinsicts.from_pinhole_model',
                                                                                                'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.from_test_model': ( 'intrinsicts.html#from_test_model',
+                                      'mvgutils.intrinsicts.Intrinsicts.from_test_model': ( 'intrinsicts.html#intrinsicts.from_test_model',
                                                                                             'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.fx': ('intrinsicts.html#fx', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.fy': ('intrinsicts.html#fy', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.get_fov': ('intrinsicts.html#get_fov', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.get_optimal_new_camera_matrix': ( 'intrinsicts.html#get_optimal_new_camera_matrix',
+                                      'mvgutils.intrinsicts.Intrinsicts.fx': ('intrinsicts.html#intrinsicts.fx', 'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.fy': ('intrinsicts.html#intrinsicts.fy', 'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.get_fov': ( 'intrinsicts.html#intrinsicts.get_fov',
+                                                                                    'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.get_optimal_new_camera_matrix': ( 'intrinsicts.html#intrinsicts.get_optimal_new_camera_matrix',
                                                                                                           'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.get_params': ( 'intrinsicts.html#get_params',
+                                      'mvgutils.intrinsicts.Intrinsicts.get_params': ( 'intrinsicts.html#intrinsicts.get_params',
                                                                                        'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.get_undistort_matrix': ( 'intrinsicts.html#get_undistort_matrix',
+                                      'mvgutils.intrinsicts.Intrinsicts.get_undistort_matrix': ( 'intrinsicts.html#intrinsicts.get_undistort_matrix',
                                                                                                  'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.h': ('intrinsicts.html#h', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.height': ('intrinsicts.html#height', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.icv_get_rectangles': ( 'intrinsicts.html#icv_get_rectangles',
+                                      'mvgutils.intrinsicts.Intrinsicts.h': ('intrinsicts.html#intrinsicts.h', 'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.height': ( 'intrinsicts.html#intrinsicts.height',
+                                                                                   'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.icv_get_rectangles': ( 'intrinsicts.html#intrinsicts.icv_get_rectangles',
                                                                                                'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.is_single_focal_lenght': ( 'intrinsicts.html#is_single_focal_lenght',
+                                      'mvgutils.intrinsicts.Intrinsicts.is_single_focal_lenght': ( 'intrinsicts.html#intrinsicts.is_single_focal_lenght',
                                                                                                    'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.project_and_distort_points': ( 'intrinsicts.html#project_and_distort_points',
+                                      'mvgutils.intrinsicts.Intrinsicts.project_and_distort_points': ( 'intrinsicts.html#intrinsicts.project_and_distort_points',
                                                                                                        'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.project_camera_plane_to_3d': ( 'intrinsicts.html#project_camera_plane_to_3d',
+                                      'mvgutils.intrinsicts.Intrinsicts.project_camera_plane_to_3d': ( 'intrinsicts.html#intrinsicts.project_camera_plane_to_3d',
                                                                                                        'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.project_points': ( 'intrinsicts.html#project_points',
+                                      'mvgutils.intrinsicts.Intrinsicts.project_points': ( 'intrinsicts.html#intrinsicts.project_points',
                                                                                            'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.resize': ('intrinsicts.html#resize', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.supported_camera_models': ( 'intrinsicts.html#supported_camera_models',
+                                      'mvgutils.intrinsicts.Intrinsicts.resize': ( 'intrinsicts.html#intrinsicts.resize',
+                                                                                   'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.supported_camera_models': ( 'intrinsicts.html#intrinsicts.supported_camera_models',
                                                                                                     'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.to_camera_points': ( 'intrinsicts.html#to_camera_points',
+                                      'mvgutils.intrinsicts.Intrinsicts.to_camera_points': ( 'intrinsicts.html#intrinsicts.to_camera_points',
                                                                                              'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.to_dict': ('intrinsicts.html#to_dict', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.to_image_points': ( 'intrinsicts.html#to_image_points',
+                                      'mvgutils.intrinsicts.Intrinsicts.to_dict': ( 'intrinsicts.html#intrinsicts.to_dict',
+                                                                                    'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.to_image_points': ( 'intrinsicts.html#intrinsicts.to_image_points',
                                                                                             'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.undistort': ( 'intrinsicts.html#undistort',
+                                      'mvgutils.intrinsicts.Intrinsicts.undistort': ( 'intrinsicts.html#intrinsicts.undistort',
                                                                                       'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.w': ('intrinsicts.html#w', 'mvgutils/intrinsicts.py'),
-                                      'mvgutils.intrinsicts.Intrinsicts.width': ('intrinsicts.html#width', 'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.w': ('intrinsicts.html#intrinsicts.w', 'mvgutils/intrinsicts.py'),
+                                      'mvgutils.intrinsicts.Intrinsicts.width': ( 'intrinsicts.html#intrinsicts.width',
+                                                                                  'mvgutils/intrinsicts.py'),
                                       'mvgutils.intrinsicts.from_homogeneous': ( 'intrinsicts.html#from_homogeneous',
                                                                                  'mvgutils/intrinsicts.py'),
                                       'mvgutils.intrinsicts.to_homogeneous': ( 'intrinsicts.html#to_homogeneous',
                                                                                'mvgutils/intrinsicts.py')},
             'mvgutils.plane3d': { 'mvgutils.plane3d.Plane3d': ('plane3d.html#plane3d', 'mvgutils/plane3d.py'),
-                                  'mvgutils.plane3d.Plane3d.__init__': ('plane3d.html#__init__', 'mvgutils/plane3d.py'),
-                                  'mvgutils.plane3d.Plane3d.__str__': ('plane3d.html#__str__', 'mvgutils/plane3d.py'),
-                                  'mvgutils.plane3d.Plane3d.fit_plane': ('plane3d.html#fit_plane', 'mvgutils/plane3d.py'),
-                                  'mvgutils.plane3d.Plane3d.from_3_points': ('plane3d.html#from_3_points', 'mvgutils/plane3d.py'),
-                                  'mvgutils.plane3d.Plane3d.from_normal_and_point': ( 'plane3d.html#from_normal_and_point',
+                                  'mvgutils.plane3d.Plane3d.__init__': ('plane3d.html#plane3d.__init__', 'mvgutils/plane3d.py'),
+                                  'mvgutils.plane3d.Plane3d.__str__': ('plane3d.html#plane3d.__str__', 'mvgutils/plane3d.py'),
+                                  'mvgutils.plane3d.Plane3d.fit_plane': ('plane3d.html#plane3d.fit_plane', 'mvgutils/plane3d.py'),
+                                  'mvgutils.plane3d.Plane3d.from_3_points': ('plane3d.html#plane3d.from_3_points', 'mvgutils/plane3d.py'),
+                                  'mvgutils.plane3d.Plane3d.from_normal_and_point': ( 'plane3d.html#plane3d.from_normal_and_point',
                                                                                       'mvgutils/plane3d.py'),
                                   'mvgutils.plane3d.Plane3d.get_span_vectors': ( 'plane3d.html#plane3d.get_span_vectors',
                                                                                  'mvgutils/plane3d.py'),
                                   'mvgutils.plane3d.Plane3d.inject_2D_points': ( 'plane3d.html#plane3d.inject_2d_points',
                                                                                  'mvgutils/plane3d.py'),
-                                  'mvgutils.plane3d.Plane3d.normal': ('plane3d.html#normal', 'mvgutils/plane3d.py'),
-                                  'mvgutils.plane3d.Plane3d.normal_to_3_points': ('plane3d.html#normal_to_3_points', 'mvgutils/plane3d.py'),
+                                  'mvgutils.plane3d.Plane3d.normal': ('plane3d.html#plane3d.normal', 'mvgutils/plane3d.py'),
+                                  'mvgutils.plane3d.Plane3d.normal_to_3_points': ( 'plane3d.html#plane3d.normal_to_3_points',
+                                                                                   'mvgutils/plane3d.py'),
                                   'mvgutils.plane3d.Plane3d.project_3D_points': ( 'plane3d.html#plane3d.project_3d_points',
                                                                                   'mvgutils/plane3d.py'),
                                   'mvgutils.plane3d.Plane3d.transform_plane': ( 'plane3d.html#plane3d.transform_plane',
                                                                                 'mvgutils/plane3d.py'),
-                                  'mvgutils.plane3d.Plane3d.x_val': ('plane3d.html#x_val', 'mvgutils/plane3d.py'),
-                                  'mvgutils.plane3d.Plane3d.y_val': ('plane3d.html#y_val', 'mvgutils/plane3d.py'),
-                                  'mvgutils.plane3d.Plane3d.z_val': ('plane3d.html#z_val', 'mvgutils/plane3d.py')},
+                                  'mvgutils.plane3d.Plane3d.x_val': ('plane3d.html#plane3d.x_val', 'mvgutils/plane3d.py'),
+                                  'mvgutils.plane3d.Plane3d.y_val': ('plane3d.html#plane3d.y_val', 'mvgutils/plane3d.py'),
+                                  'mvgutils.plane3d.Plane3d.z_val': ('plane3d.html#plane3d.z_val', 'mvgutils/plane3d.py')},
             'mvgutils.plot3d': { 'mvgutils.plot3d.init_3d_plot': ('plot3d.html#init_3d_plot', 'mvgutils/plot3d.py'),
-                                 'mvgutils.plot3d.plot_planar_rect': ('plot3d.html#plot_planar_rect', 'mvgutils/plot3d.py')}}}
\ No newline at end of file
+                                 'mvgutils.plot3d.plot_planar_rect': ('plot3d.html#plot_planar_rect', 'mvgutils/plot3d.py')}}}
@@ -1,15 +1,28 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../03_intrinsics.ipynb.
 
 # %% auto 0
-__all__ = ['SUPPORTED_CAMERA_MODELS', 'to_homogeneous', 'from_homogeneous', 'Intrinsics']
+__all__ = ['SUPPORTED_CAMERA_MODELS', 'to_homogeneous', 'from_homogeneous', 'FoV', 'Rect', 'UndistortMap', 'Intrinsics']
 
 # %% ../03_intrinsics.ipynb 3
-from typing import Tuple
-# import torch
+from typing import NamedTuple, Tuple
 import numpy as np
 import cv2
 from easydict import EasyDict as edict
 
+try:
+    import torch
+    _HAS_TORCH = True
+except ImportError:
+    # torch is optional: tensors are only handled when it is importable
+    _HAS_TORCH = False
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    # numba is optional: when missing we fall back to the NumPy implementations
+    _HAS_NUMBA = False
+
 # %% ../03_intrinsics.ipynb 5
 SUPPORTED_CAMERA_MODELS = dict(
     SIMPLE_PINHOLE = dict(id=0, n_params=3, params_str='f, cx, cy'), 
@@ -24,6 +37,32 @@ SUPPORTED_CAMERA_MODELS = dict(
     UNKNOWN        = dict(id=-1, n_params=0,params_str='[]'), 
 )
 
+# Derived lookup structures, built once at import so the constructor does not
+# re-split params_str per camera
+_MODEL_NAMES_SET = frozenset(SUPPORTED_CAMERA_MODELS)
+_MODEL_PARAM_NAMES = {name: tuple(s.strip() for s in model['params_str'].split(','))
+                      for name, model in SUPPORTED_CAMERA_MODELS.items()}
+
+
+def _build_param_layout():
+    'Pre-parse the parameter layout of every supported camera model, done once at import'
+    layouts = {}
+    for name in SUPPORTED_CAMERA_MODELS:
+        param_names = _MODEL_PARAM_NAMES[name]
+        if param_names[:1] == ('f',):
+            # Single focal length models: f, cx, cy, distortions...
+            layout = edict(fx=0, fy=0, cx=1, cy=2, dist_start=3)
+        elif param_names[:4] == ('fx', 'fy', 'cx', 'cy'):
+            layout = edict(fx=0, fy=1, cx=2, cy=3, dist_start=4)
+        else:
+            layout = None
+        layouts[name] = edict(n_params=len(param_names), layout=layout)
+    return layouts
+
+
+_PARAM_LAYOUT = _build_param_layout()
+
+
 def to_homogeneous(points):
     # from https://github.com/cvg/pixloc/blob/master/pixloc/pixlib/geometry/utils.py
     """Convert N-dimensional points to homogeneous coordinates.
@@ -35,9 +74,9 @@ def to_homogeneous(points):
     if isinstance(points, np.ndarray):
         pad = np.ones((points.shape[:-1]+(1,)), dtype=points.dtype)
         return np.concatenate([points, pad], axis=-1)
-    # elif isinstance(points, torch.Tensor):
-    #     pad = points.new_ones(points.shape[:-1]+(1,))
-    #     return torch.cat([points, pad], dim=-1)
+    elif _HAS_TORCH and isinstance(points, torch.Tensor):
+        pad = points.new_ones(points.shape[:-1]+(1,))
+        return torch.cat([points, pad], dim=-1)
     else:
         raise ValueError
 
@@ -52,6 +91,356 @@ def from_homogeneous(points):
     return points[..., :-1] / points[..., -1:]
 
 
+class FoV(NamedTuple):
+    'Horizontal and vertical field of view, in degrees'
+    fovx: float
+    fovy: float
+
+
+class Rect(NamedTuple):
+    'Axis aligned rectangle given by its top left corner and size'
+    x: float
+    y: float
+    width: float
+    height: float
+
+
+class UndistortMap(NamedTuple):
+    'Pixel maps produced by `Intrinsics.init_undistort_rectify_map` plus the matching PINHOLE camera'
+    pinhole_camera: 'Intrinsics'
+    mapx: np.ndarray
+    mapy: np.ndarray
+
+
+if _HAS_NUMBA:
+    # Fused distortion kernels: a single pass over the (N,2) buffer with no NumPy
+    # temporaries, radial polynomial evaluated in Horner form
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _distort_simple_radial_numba(xy, k1, out):
+        for i in prange(xy.shape[0]):
+            xd = xy[i, 0]
+            yd = xy[i, 1]
+            r2 = xd*xd + yd*yd
+            a = 1.0 + k1*r2
+            out[i, 0] = a*xd
+            out[i, 1] = a*yd
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _distort_radial_numba(xy, k1, k2, out):
+        for i in prange(xy.shape[0]):
+            xd = xy[i, 0]
+            yd = xy[i, 1]
+            r2 = xd*xd + yd*yd
+            a = 1.0 + r2*(k1 + r2*k2)
+            out[i, 0] = a*xd
+            out[i, 1] = a*yd
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _distort_opencv5_numba(xy, k1, k2, p1, p2, k3, out):
+        for i in prange(xy.shape[0]):
+            xd = xy[i, 0]
+            yd = xy[i, 1]
+            x2 = xd*xd
+            y2 = yd*yd
+            xdyd = xd*yd
+            r2 = x2 + y2
+            a = 1.0 + r2*(k1 + r2*(k2 + r2*k3))
+            out[i, 0] = a*xd + 2.0*p1*xdyd + p2*(r2 + 2.0*x2)
+            out[i, 1] = a*yd + p1*(r2 + 2.0*y2) + 2.0*p2*xdyd
+
+    # Fused distort + analytic Jacobian kernels for the Newton solver in
+    # undistort_points: the Jacobian of the polynomial models is closed form,
+    # which avoids the four finite-difference evaluations per iteration
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _distort_jac_simple_radial_numba(xy, k1, out, J):
+        for i in prange(xy.shape[0]):
+            x = xy[i, 0]
+            y = xy[i, 1]
+            x2 = x*x
+            y2 = y*y
+            r2 = x2 + y2
+            a = 1.0 + k1*r2
+            out[i, 0] = a*x
+            out[i, 1] = a*y
+            off = 2.0*x*y*k1
+            J[i, 0, 0] = a + 2.0*x2*k1
+            J[i, 0, 1] = off
+            J[i, 1, 0] = off
+            J[i, 1, 1] = a + 2.0*y2*k1
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _distort_jac_radial_numba(xy, k1, k2, out, J):
+        for i in prange(xy.shape[0]):
+            x = xy[i, 0]
+            y = xy[i, 1]
+            x2 = x*x
+            y2 = y*y
+            r2 = x2 + y2
+            a = 1.0 + r2*(k1 + r2*k2)
+            da = k1 + 2.0*k2*r2
+            out[i, 0] = a*x
+            out[i, 1] = a*y
+            off = 2.0*x*y*da
+            J[i, 0, 0] = a + 2.0*x2*da
+            J[i, 0, 1] = off
+            J[i, 1, 0] = off
+            J[i, 1, 1] = a + 2.0*y2*da
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _distort_jac_opencv5_numba(xy, k1, k2, p1, p2, k3, out, J):
+        for i in prange(xy.shape[0]):
+            x = xy[i, 0]
+            y = xy[i, 1]
+            x2 = x*x
+            y2 = y*y
+            r2 = x2 + y2
+            a = 1.0 + r2*(k1 + r2*(k2 + r2*k3))
+            da = k1 + r2*(2.0*k2 + 3.0*k3*r2)
+            out[i, 0] = a*x + 2.0*p1*x*y + p2*(r2 + 2.0*x2)
+            out[i, 1] = a*y + p1*(r2 + 2.0*y2) + 2.0*p2*x*y
+            off = 2.0*x*y*da + 2.0*p1*x + 2.0*p2*y
+            J[i, 0, 0] = a + 2.0*x2*da + 2.0*p1*y + 6.0*p2*x
+            J[i, 0, 1] = off
+            J[i, 1, 0] = off
+            J[i, 1, 1] = a + 2.0*y2*da + 6.0*p1*y + 2.0*p2*x
+
+    # Fused pixel->pixel kernels for init_undistort_rectify_map: unproject from the
+    # pinhole camera, distort and reproject in one pass, writing mapx/mapy directly
+    # instead of materializing the three intermediate (h*w,2) point buffers
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _build_maps_simple_radial_numba(h, w, fx_p, fy_p, cx_p, cy_p, fx, fy, cx, cy, k1, mapx, mapy):
+        for v in prange(h):
+            for u in range(w):
+                x = (u - cx_p) / fx_p
+                y = (v - cy_p) / fy_p
+                r2 = x*x + y*y
+                a = 1.0 + k1*r2
+                mapx[v, u] = fx*(a*x) + cx
+                mapy[v, u] = fy*(a*y) + cy
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _build_maps_radial_numba(h, w, fx_p, fy_p, cx_p, cy_p, fx, fy, cx, cy, k1, k2, mapx, mapy):
+        for v in prange(h):
+            for u in range(w):
+                x = (u - cx_p) / fx_p
+                y = (v - cy_p) / fy_p
+                r2 = x*x + y*y
+                a = 1.0 + r2*(k1 + r2*k2)
+                mapx[v, u] = fx*(a*x) + cx
+                mapy[v, u] = fy*(a*y) + cy
+
+
+def _mk_simple_radial(distortions):
+    'Build a distortion function for the SIMPLE_RADIAL model with the coefficients bound as locals'
+    k1 = float(distortions[0])
+
+    if _HAS_NUMBA:
+        def distort(p, out=None):
+            xy = np.ascontiguousarray(p, dtype=np.float64).reshape(-1, 2)
+            if out is None:
+                out = np.empty_like(xy)
+                _distort_simple_radial_numba(xy, k1, out)
+                return out.reshape(p.shape)
+            _distort_simple_radial_numba(xy, k1, out.reshape(-1, 2))
+            return out
+        return distort
+
+    def distort(p, out=None):
+        xd, yd = p[..., 0], p[..., 1]
+        r2 = xd*xd + yd*yd
+        a = 1.0 + k1*r2
+        if out is None:
+            out = np.empty_like(p)
+        out[..., 0] = a*xd
+        out[..., 1] = a*yd
+        return out
+    return distort
+
+
+def _mk_radial(distortions):
+    'Build a distortion function for the RADIAL model with the coefficients bound as locals'
+    k1 = float(distortions[0])
+    k2 = float(distortions[1])
+
+    if _HAS_NUMBA:
+        def distort(p, out=None):
+            xy = np.ascontiguousarray(p, dtype=np.float64).reshape(-1, 2)
+            if out is None:
+                out = np.empty_like(xy)
+                _distort_radial_numba(xy, k1, k2, out)
+                return out.reshape(p.shape)
+            _distort_radial_numba(xy, k1, k2, out.reshape(-1, 2))
+            return out
+        return distort
+
+    def distort(p, out=None):
+        xd, yd = p[..., 0], p[..., 1]
+        r2 = xd*xd + yd*yd
+        a = 1.0 + r2*(k1 + r2*k2)
+        if out is None:
+            out = np.empty_like(p)
+        out[..., 0] = a*xd
+        out[..., 1] = a*yd
+        return out
+    return distort
+
+
+def _mk_opencv5(distortions):
+    'Build a distortion function for the OPENCV5 model with the coefficients bound as locals'
+    # See https://learnopencv.com/understanding-lens-distortion/
+    k1 = float(distortions[0])
+    k2 = float(distortions[1])
+    p1 = float(distortions[2])
+    p2 = float(distortions[3])
+    k3 = float(distortions[4])
+
+    if _HAS_NUMBA:
+        def distort(p, out=None):
+            xy = np.ascontiguousarray(p, dtype=np.float64).reshape(-1, 2)
+            if out is None:
+                out = np.empty_like(xy)
+                _distort_opencv5_numba(xy, k1, k2, p1, p2, k3, out)
+                return out.reshape(p.shape)
+            _distort_opencv5_numba(xy, k1, k2, p1, p2, k3, out.reshape(-1, 2))
+            return out
+        return distort
+
+    def distort(p, out=None):
+        xd, yd = p[..., 0], p[..., 1]
+        x2 = xd*xd
+        y2 = yd*yd
+        xy = xd*yd
+        r2 = x2 + y2
+        a = 1.0 + r2*(k1 + r2*(k2 + r2*k3))
+        if out is None:
+            out = np.empty_like(p)
+        out[..., 0] = a*xd + 2.0*p1*xy + p2*(r2 + 2.0*x2)
+        out[..., 1] = a*yd + p1*(r2 + 2.0*y2) + 2.0*p2*xy
+        return out
+    return distort
+
+
+def _mk_simple_radial_jac(distortions):
+    'Build a distort + analytic Jacobian function for the SIMPLE_RADIAL model'
+    k1 = float(distortions[0])
+
+    if _HAS_NUMBA:
+        def distort_jac(p):
+            xy = np.ascontiguousarray(p, dtype=np.float64).reshape(-1, 2)
+            out = np.empty_like(xy)
+            J = np.empty((xy.shape[0], 2, 2))
+            _distort_jac_simple_radial_numba(xy, k1, out, J)
+            return out, J
+        return distort_jac
+
+    def distort_jac(p):
+        x, y = p[..., 0], p[..., 1]
+        x2 = x*x
+        y2 = y*y
+        r2 = x2 + y2
+        a = 1.0 + k1*r2
+        out = np.stack([a*x, a*y], axis=-1)
+        J = np.empty(p.shape[:-1] + (2, 2))
+        off = 2.0*x*y*k1
+        J[..., 0, 0] = a + 2.0*x2*k1
+        J[..., 0, 1] = off
+        J[..., 1, 0] = off
+        J[..., 1, 1] = a + 2.0*y2*k1
+        return out, J
+    return distort_jac
+
+
+def _mk_radial_jac(distortions):
+    'Build a distort + analytic Jacobian function for the RADIAL model'
+    k1 = float(distortions[0])
+    k2 = float(distortions[1])
+
+    if _HAS_NUMBA:
+        def distort_jac(p):
+            xy = np.ascontiguousarray(p, dtype=np.float64).reshape(-1, 2)
+            out = np.empty_like(xy)
+            J = np.empty((xy.shape[0], 2, 2))
+            _distort_jac_radial_numba(xy, k1, k2, out, J)
+            return out, J
+        return distort_jac
+
+    def distort_jac(p):
+        x, y = p[..., 0], p[..., 1]
+        x2 = x*x
+        y2 = y*y
+        r2 = x2 + y2
+        a = 1.0 + r2*(k1 + r2*k2)
+        da = k1 + 2.0*k2*r2
+        out = np.stack([a*x, a*y], axis=-1)
+        J = np.empty(p.shape[:-1] + (2, 2))
+        off = 2.0*x*y*da
+        J[..., 0, 0] = a + 2.0*x2*da
+        J[..., 0, 1] = off
+        J[..., 1, 0] = off
+        J[..., 1, 1] = a + 2.0*y2*da
+        return out, J
+    return distort_jac
+
+
+def _mk_opencv5_jac(distortions):
+    'Build a distort + analytic Jacobian function for the OPENCV5 model'
+    k1 = float(distortions[0])
+    k2 = float(distortions[1])
+    p1 = float(distortions[2])
+    p2 = float(distortions[3])
+    k3 = float(distortions[4])
+
+    if _HAS_NUMBA:
+        def distort_jac(p):
+            xy = np.ascontiguousarray(p, dtype=np.float64).reshape(-1, 2)
+            out = np.empty_like(xy)
+            J = np.empty((xy.shape[0], 2, 2))
+            _distort_jac_opencv5_numba(xy, k1, k2, p1, p2, k3, out, J)
+            return out, J
+        return distort_jac
+
+    def distort_jac(p):
+        x, y = p[..., 0], p[..., 1]
+        x2 = x*x
+        y2 = y*y
+        xy = x*y
+        r2 = x2 + y2
+        a = 1.0 + r2*(k1 + r2*(k2 + r2*k3))
+        da = k1 + r2*(2.0*k2 + 3.0*k3*r2)
+        out = np.stack([a*x + 2.0*p1*xy + p2*(r2 + 2.0*x2),
+                        a*y + p1*(r2 + 2.0*y2) + 2.0*p2*xy], axis=-1)
+        J = np.empty(p.shape[:-1] + (2, 2))
+        off = 2.0*xy*da + 2.0*p1*x + 2.0*p2*y
+        J[..., 0, 0] = a + 2.0*x2*da + 2.0*p1*y + 6.0*p2*x
+        J[..., 0, 1] = off
+        J[..., 1, 0] = off
+        J[..., 1, 1] = a + 2.0*y2*da + 6.0*p1*y + 2.0*p2*x
+        return out, J
+    return distort_jac
+
+
+def _solve_2x2(J, rhs):
+    'Solve the batched 2x2 systems J s = rhs with the closed form inverse, avoiding the LAPACK dispatch of np.linalg.solve'
+    det = J[..., 0, 0]*J[..., 1, 1] - J[..., 0, 1]*J[..., 1, 0]
+    s = np.empty_like(rhs)
+    s[..., 0] = (J[..., 1, 1]*rhs[..., 0] - J[..., 0, 1]*rhs[..., 1]) / det
+    s[..., 1] = (J[..., 0, 0]*rhs[..., 1] - J[..., 1, 0]*rhs[..., 0]) / det
+    return s
+
+
+_DISTORT_KERNELS = dict(
+    SIMPLE_RADIAL = _mk_simple_radial,
+    RADIAL        = _mk_radial,
+    OPENCV5       = _mk_opencv5,
+)
+
+_DISTORT_JAC_KERNELS = dict(
+    SIMPLE_RADIAL = _mk_simple_radial_jac,
+    RADIAL        = _mk_radial_jac,
+    OPENCV5       = _mk_opencv5_jac,
+)
+
+
 # %% ../03_intrinsics.ipynb 6
 class Intrinsics:
     'Camera intrinsic model'
@@ -62,13 +451,12 @@ class Intrinsics:
                  params: list):            # parameters, in COLMAP conventions
         # prior_focal_length : 1 if we have confidence in the modelparameters and 0 if we do not trust the model parameters
 
-        if camera_model_name not in SUPPORTED_CAMERA_MODELS:
+        if camera_model_name not in _MODEL_NAMES_SET:
             raise ValueError(f'Camera model ["{camera_model_name}"] not recognized as colmap camera model')
-        
-        param_names = SUPPORTED_CAMERA_MODELS[camera_model_name]['params_str'].split(',')
-        param_names = [p.strip() for p in param_names]
+
+        param_names = _MODEL_PARAM_NAMES[camera_model_name]
         if len(param_names) != len(params):
-            raise ValueError(f'{camera_model_name} expectes {len(param_names)} parameters but got {len(params)}') 
+            raise ValueError(f'{camera_model_name} expectes {len(param_names)} parameters but got {len(params)}')
 
         self._w = width
         self._h = height
@@ -125,28 +513,18 @@ class Intrinsics:
                          ) -> 'Intrinsics':
         'Contructing camera intrinsics model from opencv compatible data'
         if not isinstance(distortions, list):
-            if len(distortions.shape) == 2:
-                distortions = distortions.squeeze()
-            distortions= distortions.tolist()
-     
-        fx = K[0,0]
-        cx = K[0,2]
-        fy = K[1,1]
-        cy = K[1,2]
-
-        params = [fx, fy, cx, cy]
+            distortions = np.asarray(distortions).ravel().tolist()
+
         if len(distortions) == 4:
             camera_model_name = 'OPENCV'
-            params += distortions
         elif len(distortions) == 5:
             camera_model_name = 'OPENCV5'
-            params += distortions
         elif len(distortions) == 8:
             camera_model_name = 'FULL_OPENCV'
-            params += distortions
         else:
             raise ValueError(f'Do not support opencv model with {len(distortions)} parameters')
 
+        params = [K[0,0], K[1,1], K[0,2], K[1,2], *distortions]
         return Intrinsics(camera_model_name,width, height, params)
 
     @staticmethod
@@ -157,22 +535,13 @@ class Intrinsics:
                          ) -> 'Intrinsics':
         'Contructing camera intrinsics model from data compatible with opencv fisheye model'
         if not isinstance(distortions, list):
-            if len(distortions.shape) == 2:
-                distortions = distortions.squeeze()
-            distortions= distortions.tolist()
-     
-        fx = K[0,0]
-        cx = K[0,2]
-        fy = K[1,1]
-        cy = K[1,2]
-
-        params = [fx, fy, cx, cy]
-        if len(distortions) == 4:
-            camera_model_name = 'OPENCV'
-            params += distortions
-        else:
+            distortions = np.asarray(distortions).ravel().tolist()
+
+        if len(distortions) != 4:
             raise ValueError(f'Do not support fisheye-opencv model with {len(distortions)} parameters')
 
+        camera_model_name = 'OPENCV'
+        params = [K[0,0], K[1,1], K[0,2], K[1,2], *distortions]
         return Intrinsics(camera_model_name,width, height, params)
 
     @staticmethod
@@ -225,22 +594,22 @@ class Intrinsics:
     @property
     def fx(self):
         'Returns the (x) focal point in pixels'
-        return self._K[0,0]
+        return self._fx_f
 
     @property
     def fy(self):
         'Returns the (y) forcal point in pixels'
-        return self._K[1,1]
+        return self._fy_f
 
     @property
     def cx(self):
         'Returns the x coordinate of the camera center in pixels'
-        return self._K[0,2]
+        return self._cx_f
 
     @property
     def cy(self):
         'Returns the y coordinate of the camera center in pixels'
-        return self._K[1,2]
+        return self._cy_f
 
     @property
     def w(self):
@@ -278,7 +647,7 @@ class Intrinsics:
     @property
     def K_3(self) -> np.ndarray:
         'Return the 3x3 camera matrix in npn homogenous coordinates'
-        return self._K[:3,:3]
+        return self._K_3
 
     @property
     def K_3_inv(self) -> np.ndarray:
@@ -290,13 +659,13 @@ class Intrinsics:
         'Returns 1D distortion array'
         return self._distortions
 
-    def get_fov(self) -> edict:
+    def get_fov(self) -> FoV:
         'Get horizontal and vertical field of view of the canera, in degrees'
         # Zeliltsky 2.60
         fovx = 2 * np.rad2deg(np.arctan2(self.width , (2 * self.fx)))
         fovy = 2 * np.rad2deg(np.arctan2(self.height , (2 * self.fy)))
 
-        return edict(fovx=fovx, fovy=fovy)
+        return FoV(fovx=fovx, fovy=fovy)
 
     @property
     def params(self) -> list:
@@ -333,7 +702,7 @@ class Intrinsics:
         # cx  = (self.cx+0.5) * scale_w - 0.5   # cx
         # cy  = (self.cy+0.5) * scale_h - 0.5   # cy
 
-        new_params = self._get_params_to_new_cx_cy_fx_fy(cx, cy, fx, fy)
+        new_params = self._pack_params(fx, fy, cx, cy)
 
         return Intrinsics(
             camera_model_name=self.camera_model_name, 
@@ -377,7 +746,7 @@ class Intrinsics:
         new_width = crop_size[0]
         new_height =crop_size[1]
 
-        new_params = self._get_params_to_new_cx_cy_fx_fy(new_cx, new_cy, self.fx, self.fx)
+        new_params = self._pack_params(self.fx, self.fy, new_cx, new_cy)
 
         return Intrinsics(
             camera_model_name=self.camera_model_name, 
@@ -434,21 +803,44 @@ class Intrinsics:
   
     def init_undistort_rectify_map(self, 
                                   alpha   # A number between 0 (all pixels in the undistorted image are valid) and 1 (all source images are retained but there are some black pixels)
-                                  ) -> edict: # dict with entries: "pinhole_camera", "mapx", "mapy" consisting of all infor needed to undistort an image
+                                  ) -> UndistortMap: # NamedTuple with fields "pinhole_camera", "mapx", "mapy" consisting of all infor needed to undistort an image
         'Return parameters needed for image undistortion plut the PINHOLE camera model of the undistorted image'
         pinhole_camera = self.get_undistort_camera(alpha)
 
+        if self.camera_model_name in ('OPENCV', 'OPENCV5', 'FULL_OPENCV'):
+            # These are exactly the models cv2.initUndistortRectifyMap implements, so
+            # delegate to the optimized OpenCV implementation
+            mapx, mapy = cv2.initUndistortRectifyMap(
+                self.K_3, np.asarray(self.distortions), None, pinhole_camera.K_3,
+                (pinhole_camera.w, pinhole_camera.h), cv2.CV_32FC1)
+            return UndistortMap(pinhole_camera=pinhole_camera, mapx=mapx, mapy=mapy)
+
+        if self.camera_model_name == 'OPENCV_FISHEYE':
+            mapx, mapy = cv2.fisheye.initUndistortRectifyMap(
+                self.K_3, np.asarray(self.distortions), np.eye(3), pinhole_camera.K_3,
+                (pinhole_camera.w, pinhole_camera.h), cv2.CV_32FC1)
+            return UndistortMap(pinhole_camera=pinhole_camera, mapx=mapx, mapy=mapy)
+
+        if _HAS_NUMBA and self.camera_model_name in ('SIMPLE_RADIAL', 'RADIAL'):
+            # Fused kernel: unproject, distort and reproject per pixel without the
+            # intermediate (h*w,2) point buffers of the NumPy path below
+            mapx = np.empty((pinhole_camera.h, pinhole_camera.w), dtype=np.float32)
+            mapy = np.empty((pinhole_camera.h, pinhole_camera.w), dtype=np.float32)
+            d = self.distortions
+            args = (pinhole_camera.h, pinhole_camera.w,
+                    pinhole_camera.fx, pinhole_camera.fy, pinhole_camera.cx, pinhole_camera.cy,
+                    self.fx, self.fy, self.cx, self.cy)
+            if self.camera_model_name == 'SIMPLE_RADIAL':
+                _build_maps_simple_radial_numba(*args, d[0], mapx, mapy)
+            else:
+                _build_maps_radial_numba(*args, d[0], d[1], mapx, mapy)
+            return UndistortMap(pinhole_camera=pinhole_camera, mapx=mapx, mapy=mapy)
+
         # See https://docs.opencv.org/3.4/da/d54/group__imgproc__transform.html#ga7dfb72c9cf9780a347fbe3d1c47e5d5a
         # code - line 64 in https://github.com/egonSchiele/OpenCV/blob/master/modules/imgproc/src/undistort.cpp
-        mapx = np.zeros((pinhole_camera.h, pinhole_camera.w), dtype=np.float32)
-        mapy = np.zeros((pinhole_camera.h, pinhole_camera.w), dtype=np.float32)
-
-        u = list(range(pinhole_camera.w))
-        v = list(range(pinhole_camera.h))
-        xv, yv = np.meshgrid(u, v)
-        xv = xv.reshape(pinhole_camera.h*pinhole_camera.w)
-        yv = yv.reshape(pinhole_camera.h*pinhole_camera.w)
-        points = np.stack([xv,yv]).T
+        xv, yv = np.meshgrid(np.arange(pinhole_camera.w, dtype=np.float64),
+                             np.arange(pinhole_camera.h, dtype=np.float64))
+        points = np.stack([xv.ravel(), yv.ravel()], axis=1)
 
         # Undistort all points from the pinhole camera
         p_undistorted = pinhole_camera.to_camera_points(points)  # from pinhole camera pixels to (undistorted) camera plane
@@ -458,12 +850,12 @@ class Intrinsics:
         mapx = pix[:,0].reshape((pinhole_camera.h,pinhole_camera.w)).astype(np.float32)   # maping of x pixels so mapx[u,v] is the x index of that pixel in self
         mapy = pix[:,1].reshape((pinhole_camera.h,pinhole_camera.w)).astype(np.float32)   # maping of y pixels so mapx[u,v] is the y index of that pixel in self
 
-        return edict(pinhole_camera=pinhole_camera, mapx=mapx, mapy=mapy)
+        return UndistortMap(pinhole_camera=pinhole_camera, mapx=mapx, mapy=mapy)
 
     @staticmethod
     def undistort_image( 
                         img: np.ndarray,          # Input image
-                        undistorted_info: edict   # The output from 'init_undistort_rectify_map'
+                        undistorted_info: UndistortMap   # The output from 'init_undistort_rectify_map'
                         ) -> np.ndarray:          # undistorted image
 
         # See https://opencv24-python-tutorials.readthedocs.io/en/stable/py_tutorials/py_calib3d/py_calibration/py_calibration.html
@@ -526,101 +918,162 @@ class Intrinsics:
         return p_camera_plane_distorted, disparity, valid
 
     def project_points(
-        self, 
-        pc3d: np.ndarray,                                  # 3D points in camera frame, with shape (N,3) 
-        projection_type: str = 'perspective'     # Projection type
+        self,
+        pc3d: np.ndarray,                                  # 3D points in camera frame, with shape (N,3)
+        projection_type: str = 'perspective',    # Projection type
+        out: np.ndarray = None                   # Optional preallocated (N,2) output buffer for the projected points
         ) -> Tuple[np.ndarray, np.ndarray, np.ndarray] :   # A 2D point in the camera plane with shape (N,2), disparities with shape (N,1) and boolean valid mask with shape (N,)
         'Project 3D points in camera frame to 2D points in the camera plane'
         eps = 1e-3
 
+        if _HAS_TORCH and isinstance(pc3d, torch.Tensor):
+            z = pc3d[..., -1]
+            valid = z > eps
+            disparity = 1.0 / z.clamp(min=eps).unsqueeze(-1)
+            p2d = pc3d[..., :-1] * disparity
+            return p2d, disparity, valid
+
         z = pc3d[..., -1]
         valid = z > eps
-        z = z.clip(min=eps)
-        disparity = 1.0 / np.expand_dims(z,-1)
-        p2d = pc3d[..., :-1] * disparity
-        return p2d, disparity, valid
+
+        # Clip and invert in place inside the disparity buffer, no throwaway temporaries
+        disparity = np.empty(z.shape + (1,))
+        disparity_1d = disparity[..., 0]
+        np.maximum(z, eps, out=disparity_1d)
+        np.reciprocal(disparity_1d, out=disparity_1d)
+
+        if out is None:
+            out = np.empty(pc3d.shape[:-1] + (2,))
+        np.multiply(pc3d[..., 0], disparity_1d, out=out[..., 0])
+        np.multiply(pc3d[..., 1], disparity_1d, out=out[..., 1])
+        return out, disparity, valid
 
     def distort_points(
-        self, 
-        p_cam_undistorted: np.ndarray # 2D Undistorted point in the camera plane with shape (N,2)
-        ) -> np.ndarray:              # 2D distorted point in the camera plane with shape (N,2)
+        self,
+        p_cam_undistorted: np.ndarray, # 2D Undistorted point in the camera plane with shape (N,2)
+        out: np.ndarray = None         # Optional preallocated output buffer with the same shape, to avoid the per-call allocation
+        ) -> np.ndarray:               # 2D distorted point in the camera plane with shape (N,2)
         'Distort points in the camera plane'
         # see line 888 in https://github.com/colmap/colmap/blob/dev/src/base/camera_models.h
-        camera_model_name = self.camera_model_name
-        distortions = self.distortions
-        if len(distortions) == 0:
-            return  p_cam_distorted.copy()
-
+        if self._is_identity_distortion:
+            if _HAS_TORCH and isinstance(p_cam_undistorted, torch.Tensor):
+                if out is not None:
+                    return out.copy_(p_cam_undistorted)
+                return p_cam_undistorted.clone()
+            if out is not None:
+                np.copyto(out, p_cam_undistorted)
+                return out
+            return  p_cam_undistorted.copy()
+
+        if _HAS_TORCH and isinstance(p_cam_undistorted, torch.Tensor):
+            p_cam_distorted = self._distort_points_torch(p_cam_undistorted)
+            if out is not None:
+                return out.copy_(p_cam_distorted)
+            return p_cam_distorted
 
         if self.camera_model_name in ['OPENCV', 'FULL_OPENCV','OPENCV_FISHEYE']:
             raise ValueError(f'Function distort_points can not be used for OpenCv models since the do projection and distortion in a single function call, thus require 3D points as input')
-        elif camera_model_name == 'SIMPLE_RADIAL':
-            k1 = distortions[0]
-            xd, yd = p_cam_undistorted[..., 0], p_cam_undistorted[..., 1]
-
-            x2 = xd*xd
-            y2 = yd*yd
-            r2 = x2 + y2
-            a = 1.0 + k1*r2  
-            xu = a*xd 
-            yu = a*yd 
-    
-            p_cam_distorted = np.stack([xu,yu], axis=-1)
-            return p_cam_distorted
-        elif camera_model_name == 'RADIAL':
-            k1 = distortions[0]
-            k2 = distortions[1]
-
-            xd, yd = p_cam_undistorted[..., 0], p_cam_undistorted[..., 1]
-
-            x2 = xd*xd
-            y2 = yd*yd
-            r2 = x2 + y2
-            r4 = r2*r2
-
-            a = 1.0 + k1*r2  + k2*r4 
-            xu = a*xd 
-            yu = a*yd 
-    
-            p_cam_distorted = np.stack([xu,yu], axis=-1)
 
-            return p_cam_distorted
-        elif camera_model_name == 'OPENCV5':
-            # See https://learnopencv.com/understanding-lens-distortion/
-            k1 = distortions[0]
-            k2 = distortions[1]
-            p1 = distortions[2]
-            p2 = distortions[3] 
-            k3 = distortions[4]
+        if self._distort_fn is None:
+            raise ValueError(f'distort_points not impelmented for camera model [{self.camera_model_name}]')
 
-            xd, yd = p_cam_undistorted[..., 0], p_cam_undistorted[..., 1]
+        # The kernel was bound once in _set_params, with the distortion coefficients captured as locals
+        return self._distort_fn(p_cam_undistorted, out=out)
+
+    def _distort_points_torch(self, p):
+        'Torch implementation of `distort_points`, keeps the tensors on their device'
+        name = self.camera_model_name
+        d = [float(v) for v in self._distortions]
+        x, y = p[..., 0], p[..., 1]
+        r2 = x*x + y*y
+
+        if name == 'SIMPLE_RADIAL':
+            a = 1.0 + d[0]*r2
+            return torch.stack([a*x, a*y], dim=-1)
+        elif name == 'RADIAL':
+            a = 1.0 + r2*(d[0] + r2*d[1])
+            return torch.stack([a*x, a*y], dim=-1)
+        elif name == 'OPENCV5':
+            k1, k2, p1, p2, k3 = d
+            x2 = x*x
+            y2 = y*y
+            xy = x*y
+            a = 1.0 + r2*(k1 + r2*(k2 + r2*k3))
+            xu = a*x + 2.0*p1*xy + p2*(r2 + 2.0*x2)
+            yu = a*y + p1*(r2 + 2.0*y2) + 2.0*p2*xy
+            return torch.stack([xu, yu], dim=-1)
+        else:
+            raise ValueError(f'distort_points not impelmented for camera model [{name}]')
+
+    def _distort_jac_torch(self, p):
+        'Torch implementation of the fused distort + analytic Jacobian used by `undistort_points`'
+        name = self.camera_model_name
+        d = [float(v) for v in self._distortions]
+        x, y = p[..., 0], p[..., 1]
+        x2 = x*x
+        y2 = y*y
+        xy = x*y
+        r2 = x2 + y2
+
+        if name == 'SIMPLE_RADIAL':
+            k1 = d[0]
+            a = 1.0 + k1*r2
+            out = torch.stack([a*x, a*y], dim=-1)
+            da = k1 + torch.zeros_like(r2)
+            j00 = a + 2.0*x2*da
+            j01 = 2.0*xy*da
+            j10 = j01
+            j11 = a + 2.0*y2*da
+        elif name == 'RADIAL':
+            k1, k2 = d
+            a = 1.0 + r2*(k1 + r2*k2)
+            da = k1 + 2.0*k2*r2
+            out = torch.stack([a*x, a*y], dim=-1)
+            j00 = a + 2.0*x2*da
+            j01 = 2.0*xy*da
+            j10 = j01
+            j11 = a + 2.0*y2*da
+        elif name == 'OPENCV5':
+            k1, k2, p1, p2, k3 = d
+            a = 1.0 + r2*(k1 + r2*(k2 + r2*k3))
+            da = k1 + r2*(2.0*k2 + 3.0*k3*r2)
+            out = torch.stack([a*x + 2.0*p1*xy + p2*(r2 + 2.0*x2),
+                               a*y + p1*(r2 + 2.0*y2) + 2.0*p2*xy], dim=-1)
+            j00 = a + 2.0*x2*da + 2.0*p1*y + 6.0*p2*x
+            j01 = 2.0*xy*da + 2.0*p1*x + 2.0*p2*y
+            j10 = j01
+            j11 = a + 2.0*y2*da + 6.0*p1*y + 2.0*p2*x
+        else:
+            raise ValueError(f'undistort_points not impelmented for camera model [{name}] with torch tensors')
 
-            x2 = xd*xd
-            y2 = yd*yd
-            xy = xd*yd
-            r2 = x2 + y2
-            r4 = r2*r2
-            r6 = r2*r4
+        return out, j00, j01, j10, j11
 
-            a = 1.0 + k1*r2  + k2*r4 + k3*r6
-            xu = a*xd + 2.0*p1*xy + p2*(r2 + 2.0*x2)
-            yu = a*yd + p1*(r2+2.0*y2) + 2.0*p2*xy
-    
-            p_cam_distorted = np.stack([xu,yu], axis=-1)
-
-            return p_cam_distorted
-        else:
-            raise ValueError(f'distort_points not impelmented for camera model [{self.camera_model_name}]')
+    def _torch_affine(self, device, dtype):
+        'Return the cached ([fx,fy], [cx,cy], [1/fx,1/fy]) tensors for a device and dtype'
+        key = (str(device), dtype)
+        cached = self._torch_affine_cache.get(key)
+        if cached is None:
+            cached = (torch.tensor([self.fx, self.fy], device=device, dtype=dtype),
+                      torch.tensor([self.cx, self.cy], device=device, dtype=dtype),
+                      torch.tensor([1.0/self.fx, 1.0/self.fy], device=device, dtype=dtype))
+            self._torch_affine_cache[key] = cached
+        return cached
 
     def to_image_points(
         self,
         pc_distorted: np.ndarray  # 2D points in the camera plane with shape (N,2)
         ) -> np.ndarray:          # 2D points in the image plane with shape (N,2)
         'Transform points from the camera plane to the image plane, using the camera matrix K'
- 
-        pcd_h = to_homogeneous(pc_distorted)
-        pix_T = pcd_h @ self.K_3.T
-        return pix_T[..., :-1]
+
+        # K is affine for points with last homogenous coordinate 1, so the 3x3 matmul
+        # through homogenous coordinates reduces to a scale and a shift
+        if _HAS_TORCH and isinstance(pc_distorted, torch.Tensor):
+            fxy, cxy, _ = self._torch_affine(pc_distorted.device, pc_distorted.dtype)
+            return pc_distorted * fxy + cxy
+
+        pix = np.multiply(pc_distorted, self._fxy)
+        pix += self._cxy
+        return pix
 
     #----------------
     # image2camera
@@ -630,10 +1083,14 @@ class Intrinsics:
         pu: np.ndarray,                  # points in the image plane, shape is (N,2)
         ) -> np.ndarray: # points in distorted camera plane, shape (N,2)
         'Transform pixel image coordinates into the distorted camera plane'
-        pu_h = to_homogeneous(pu)
-        pd_h_T = pu_h @ self.K_3_inv.T
-        pd = pd_h_T[..., :-1]          
-        return pd 
+        # Inverse of the affine transform applied in to_image_points
+        if _HAS_TORCH and isinstance(pu, torch.Tensor):
+            _, cxy, inv_fxy = self._torch_affine(pu.device, pu.dtype)
+            return (pu - cxy) * inv_fxy
+
+        pd = np.subtract(pu, self._cxy)
+        pd *= self._inv_fxy
+        return pd
 
 
     def undistort_points(self, 
@@ -641,91 +1098,137 @@ class Intrinsics:
                   ) -> np.ndarray:          # Undistorted points in the image plane
         'Undistort points in the image plane using the inverse of the distortion model for that camera model'
         # see line 565 in https://github.com/colmap/colmap/blob/dev/src/base/camera_models.h
-        eps = np.finfo(np.float64).eps
-        N = pc_distorted.shape[0]
-
         kNumIterations = 17
         kMaxStepNorm = np.float32(1e-10)
-        kRelStepSize = np.float32(1e-6)
 
-        J = np.zeros((N,2,2))
+        # Pinhole cameras (or all-zero coefficients) distort nothing, skip Newton entirely
+        if self._is_identity_distortion:
+            if _HAS_TORCH and isinstance(pc_distorted, torch.Tensor):
+                return pc_distorted.clone()
+            return pc_distorted.copy()
+
+        if _HAS_TORCH and isinstance(pc_distorted, torch.Tensor):
+            # Newton with the analytic Jacobian, all tensor ops stay on the device
+            p0 = pc_distorted
+            x = pc_distorted.clone()
+            for _ in range(kNumIterations):
+                dx, j00, j01, j10, j11 = self._distort_jac_torch(x)
+                rhs = dx - p0
+                det = j00*j11 - j01*j10
+                s0 = (j11*rhs[..., 0] - j01*rhs[..., 1]) / det
+                s1 = (j00*rhs[..., 1] - j10*rhs[..., 0]) / det
+                sx = torch.stack([s0, s1], dim=-1)
+                x = x - sx
+
+                if sx.numel() and sx.abs().max() < kMaxStepNorm:
+                    break
+
+            return x   # undistorted
+
+        if self.camera_model_name in ('OPENCV', 'FULL_OPENCV'):
+            # With K = I cv2.undistortPoints maps camera-plane points to camera-plane
+            # points, and the coefficient order of these models matches OpenCV's
+            und = cv2.undistortPoints(
+                np.ascontiguousarray(pc_distorted, dtype=np.float64).reshape(-1, 1, 2),
+                np.eye(3), np.asarray(self.distortions))
+            return und.reshape(pc_distorted.shape)
+
+        if self.camera_model_name == 'OPENCV_FISHEYE':
+            und = cv2.fisheye.undistortPoints(
+                np.ascontiguousarray(pc_distorted, dtype=np.float64).reshape(1, -1, 2),
+                np.eye(3), np.asarray(self.distortions))
+            return und.reshape(pc_distorted.shape)
+
+        if self._distort_jac_fn is None:
+            # Every model with a distort_points kernel also has an analytic Jacobian;
+            # the remaining models cannot be distorted point-wise in the first place
+            raise ValueError(f'undistort_points not impelmented for camera model [{self.camera_model_name}]')
+
         p0 = pc_distorted.copy()
         x = pc_distorted.copy()
-        for i in range(kNumIterations):
-            x0 = x[..., 0]
-            x1 = x[..., 1]
-            step0 = np.maximum(eps, kRelStepSize * x0)
-            step1 = np.maximum(eps, kRelStepSize * x1)
-
-            dx = self.distort_points(x)
-
-            # Compute numerical Jacobian
-            dx_0b = self.distort_points(np.array([x0 - step0, x1]).T)
-            dx_0f = self.distort_points(np.array([x0 + step0, x1]).T)
-            dx_1b = self.distort_points(np.array([x0        , x1 - step1]).T)
-            dx_1f = self.distort_points(np.array([x0        , x1 + step1]).T)
-            J[:,0, 0] = 1 + (dx_0f[...,0] - dx_0b[...,0]) / (2 * step0)
-            J[:,0, 1] = (dx_1f[...,0] - dx_1b[...,0]) / (2 * step1)
-            J[:,1, 0] = (dx_0f[...,1] - dx_0b[...,1]) / (2 * step0)
-            J[:,1, 1] = 1 + (dx_1f[...,1] - dx_1b[...,1]) / (2 * step1)
-    
-            jac_invs = np.linalg.inv(J)
-            for i in range(N):
-                jinv = jac_invs[i,...]
-                rhs = (dx - p0)[i,:]
-                sx = jinv @ rhs
-                x[i,:] -= sx
- 
 
-                                                    
+        # Newton with the analytic Jacobian of the distortion model
+        for _ in range(kNumIterations):
+            dx, J = self._distort_jac_fn(x)
+            sx = _solve_2x2(J, dx - p0)
+            x -= sx
+
+            # The size guard keeps the reduction from raising on empty input
+            if sx.size and np.max(np.abs(sx)) < kMaxStepNorm:
+                break
+
         return  x   # undistorted
 
 
     def _set_params(self, camera_model_name, params):
-        param_names = SUPPORTED_CAMERA_MODELS[camera_model_name]['params_str'].split(',')
-        param_names = [p.strip() for p in param_names]
-        if len(param_names) != len(params):
-            raise ValueError(f'{camera_model_name} expectes {len(param_names)} parameters but got {len(params)}') 
+        model_layout = _PARAM_LAYOUT[camera_model_name]
+        if model_layout.n_params != len(params):
+            raise ValueError(f'{camera_model_name} expectes {model_layout.n_params} parameters but got {len(params)}')
 
         self._params = params
-        
-        # First names should be one of f,fx,fy,cx,cy
-        camera_matrix_components = ['f','fx','fy','cx','cy']
-        dlist = []
-        cp = edict(fx=0.,fy=0.,cx=0.,cy=0.)
-        for i, (name, val) in enumerate(zip(param_names,params)):
-#             print(name,val)
-            if name not in camera_matrix_components:
-                dlist.append(val)
-            elif name == 'f': 
-                cp.fx = val
-                cp.fy = val
-            else:
-                cp[name] = val
 
-        self._K = np.array(
-            [
-                [cp.fx, 0.0,     cp.cx,     0.0],
-                [0.0,     cp.fy, cp.cy,     0.0],
-                [0.0,     0.0,     1.0,     0.0 ],
-                [0.0,     0.0,     0.0,     1.0 ]
-            ]
-        )
-    
+        # Index the parameter list directly through the layout precomputed at import
+        layout = model_layout.layout
+        if layout is None:
+            fx = fy = cx = cy = 0.0
+            dlist = []
+        else:
+            fx = params[layout.fx]
+            fy = params[layout.fy]
+            cx = params[layout.cx]
+            cy = params[layout.cy]
+            dlist = params[layout.dist_start:]
+        cp = edict(fx=fx, fy=fy, cx=cx, cy=cy)
+
+        self._K = np.zeros((4,4))
+        self._K[0,0] = cp.fx
+        self._K[1,1] = cp.fy
+        self._K[0,2] = cp.cx
+        self._K[1,2] = cp.cy
+        self._K[2,2] = 1.0
+        self._K[3,3] = 1.0
+
         self._K_inv = np.linalg.inv(self._K)
-        self._K_3_inv = np.linalg.inv(self._K[:3,:3])
+        self._K_3 = self._K[:3,:3].copy()
+        self._K_3_inv = np.linalg.inv(self._K_3)
+
+        # Plain Python floats so the fx/fy/cx/cy properties do not slice a fresh
+        # 0-d array out of self._K on every access
+        self._fx_f = float(cp.fx)
+        self._fy_f = float(cp.fy)
+        self._cx_f = float(cp.cx)
+        self._cy_f = float(cp.cy)
+
+        # Cached affine components of K, so to_image_points/to_camera_points do not
+        # slice scalars out of self._K on every call
+        self._fxy = np.array([cp.fx, cp.fy])
+        self._cxy = np.array([cp.cx, cp.cy])
+        self._inv_fxy = np.array([1.0/cp.fx, 1.0/cp.fy])
+
+        # Torch copies of the affine vectors, built lazily per (device, dtype)
+        self._torch_affine_cache = {}
 
         self._distortions = np.array(dlist, dtype=np.float64)
 
+        # Distortions as a plain list, reused when repacking parameters in scale/crop
+        self._dist_list = [float(d) for d in self._distortions]
+
+        # True when distortion is a no-op (no coefficients or all of them zero)
+        self._is_identity_distortion = self._distortions.size == 0 or not np.any(self._distortions)
+
+        # Bind the distortion kernel once so distort_points does not re-dispatch on the model name
+        factory = _DISTORT_KERNELS.get(camera_model_name)
+        self._distort_fn = factory(self._distortions) if factory is not None else None
+
+        jac_factory = _DISTORT_JAC_KERNELS.get(camera_model_name)
+        self._distort_jac_fn = jac_factory(self._distortions) if jac_factory is not None else None
+
     
-    def _get_params_to_new_cx_cy_fx_fy(self, new_cx, new_cy, new_fx, new_fy):
+    def _pack_params(self, fx, fy, cx, cy):
+        'Build the constructor parameter list for this camera model with new camera matrix entries'
         if self.is_single_focal_lenght():
-            cp = [new_fx, new_cx, new_cy]
-        else:
-            cp =  [new_fx, new_fy, new_cx, new_cy]
-
-        p = cp + [float(d) for d in self.distortions]
-        return p
+            return [fx, cx, cy, *self._dist_list]
+        return [fx, fy, cx, cy, *self._dist_list]
 
 
     def _icv_get_rectangles(self):
@@ -734,46 +1237,31 @@ class Intrinsics:
         x_step = self.w / (N-1)
         y_step = self.h / (N-1)
 
-        points = np.zeros((N*N, 2))
-        k= 0
-        for y in range(N):
-            yp = y*y_step
-            for x in range(N):
-                xp = x*x_step
-                points[k] = np.array([xp,yp])
-                k += 1
+        xs = np.arange(N) * x_step
+        ys = np.arange(N) * y_step
+        xx, yy = np.meshgrid(xs, ys)
+        points = np.column_stack([xx.ravel(), yy.ravel()])
 
         p_camere_distorted = self.to_camera_points(points)
         p_camera_undistorted = self.undistort_points(p_camere_distorted)
 
-
-        k= 0
-        xu_left = []
-        xu_right = []
-        yu_bottom = [] 
-        yu_top = []         
-
-        for y in range(N):
-            yp = y*y_step
-            for x in range(N):
-                xp = x*x_step
-                pu = p_camera_undistorted[k]
-                k += 1
-                if x == 0: xu_left.append(pu[0])
-                if x == N-1: xu_right.append(pu[0])
-                if y == 0: yu_top.append(pu[1])
-                if y == N-1: yu_bottom.append(pu[1])
+        # Border points of the N x N grid, gathered by slicing instead of a Python loop
+        pu = p_camera_undistorted.reshape(N, N, 2)
+        xu_left = pu[:, 0, 0]
+        xu_right = pu[:, -1, 0]
+        yu_top = pu[0, :, 1]
+        yu_bottom = pu[-1, :, 1]
 
         pmax = np.max(p_camera_undistorted, axis=0)
         pmin = np.min(p_camera_undistorted, axis=0)
-        outer = edict(x=pmin[0], y=pmin[1], width=pmax[0]-pmin[0], height=pmax[1]-pmin[1])
+        outer = Rect(x=pmin[0], y=pmin[1], width=pmax[0]-pmin[0], height=pmax[1]-pmin[1])
 
 
         xmin_i = np.max(xu_left)
         xmax_i = np.min(xu_right)
         ymin_i = np.max(yu_top)
         ymax_i = np.min(yu_bottom)
-        inner = edict(x=xmin_i, y=ymin_i, width=xmax_i-xmin_i, height=ymax_i-ymin_i)
+        inner = Rect(x=xmin_i, y=ymin_i, width=xmax_i-xmin_i, height=ymax_i-ymin_i)
 
         return outer, inner
 